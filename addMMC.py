@@ -1,25 +1,26 @@
 import sqlite3
 from typing import Dict, List, Tuple
-import challonge
 import os
 import datetime
 import json
-import pandas as pd
-from credentials import userID, apiKey
+from createMMCDB import readNames
 
-mmc: int = 106
 playerRaces: Dict[str,List[str]] = dict() # for being able to reference a players race/offrace when inputing match data. List has main race first and offrace second
 participantID: Dict[str, str] = dict() # for quick referencing a player name with their ID
 
 def connect(dbName: str="mmc.db") -> sqlite3.Connection:
     return sqlite3.connect(dbName)
 
-def pullMMCData() -> None:
+def pullMMCData(mmc: int) -> None:
     """
     Function used for pulling the data from a specific MMC using the challonge API
     This function will pull the participant and matches data from the specified MMC
     and put it into the MMC folder
+    :param mmc: the edition of MMC to pull
     """
+    # challonge and the credentials are only needed here, so they are not imported when the json files are already saved
+    import challonge
+    from credentials import userID, apiKey
     # set challonge credentials
     challonge.set_credentials(userID, apiKey)
     # query the api for an index of all tournaments associated with the challonge account
@@ -27,15 +28,15 @@ def pullMMCData() -> None:
     # query the api for an index of all tournaments associated with the challonge account
     tourney: str = f"MagikarpMastersCup{mmc}"
     # find the tournament id for the MMC in question
+    tournamentID = None
     for t in tournaments:
         if tourney == t["url"]:
             tournamentID = t["id"]
             break
-    # try making the specific folder for this MMC
-    try:
-        os.mkdir(f"MMC/mmc{mmc}")
-    except:
-        pass
+    if tournamentID is None:
+        raise ValueError(f"{tourney} was not found on the challonge account")
+    # make the specific folder for this MMC if it doesn't exist yet
+    os.makedirs(f"MMC/mmc{mmc}", exist_ok=True)
     # get the participant data
     with open(f"MMC/mmc{mmc}/participants.json", "w") as outfile:
         # get all the participants from a specific tournament
@@ -61,38 +62,25 @@ def pullMMCData() -> None:
 
     return
 
-def newChallongeNames(c: sqlite3.Cursor, conn: sqlite3.Connection) -> None:
+def newChallongeNames(mmc: int) -> List[str]:
     """
     Function for checking to see if there are any new players that have never participated before.
     Checks all challonge usernames to see if they have been seen before. 
-    If not, those names are printed out and the program is stopped.
-    Go add those names to Names.csv and rerun the script.
-    :param c: an sqlite3 cursor
-    :param conn: an sqlite3 connection
+    If not, those names need to be added to Names.csv before the data can be inserted.
+    :param mmc: the edition of MMC to check
+    :returns: a sorted list of the challonge usernames missing from Names.csv
     """
     # load the participants.json file
-    partsFile = open(f"MMC/mmc{mmc}/participants.json", "r")
-    partsData = json.loads(partsFile.read())
+    with open(f"MMC/mmc{mmc}/participants.json", "r") as partsFile:
+        partsData = json.loads(partsFile.read())
     # load the Names.csv file to check for new names
-    namesFile = pd.read_csv("Names.csv",encoding="utf-16",delimiter="\t")
-    names = namesFile["Name"].to_list()
+    names = set(row["Name"] for row in readNames())
     newNames = set()
     # get every username from the json file
     for p in partsData:
         newNames.add(p["name"])
     # check each name to see if it is new
-    end = False
-    for name in newNames:
-        if name not in names:
-            print(name)
-            end = True
-
-    partsFile.close()
-    if end:
-        conn.close()
-        exit(1)
-    else:
-        return
+    return sorted(name for name in newNames if name not in names)
 
 def scoreFix(score: str) -> Tuple[int, int]:
     """
@@ -143,14 +131,17 @@ def scoreFix(score: str) -> Tuple[int, int]:
 
     return winner, loser
 
-def insertData(c: sqlite3.Cursor, conn: sqlite3.Connection) -> None:
+def insertData(c: sqlite3.Cursor, conn: sqlite3.Connection, mmc: int) -> None:
     """
     Function to insert the data for the new MMC into the mmc.db sqlite database
     :param c: sqlite3 cursor
     :param conn: sqlite3 connection
+    :param mmc: the edition of MMC to insert
     """
-    # load names csv file
-    namesFile = pd.read_csv("Names.csv",encoding="utf-16",delimiter="\t")
+    # load names csv file, keyed by challonge username. If a username appears more than once the first row is used
+    namesFile: Dict[str, Dict[str, str]] = dict()
+    for row in readNames():
+        namesFile.setdefault(row["Name"], row)
 
     # data to be pulled from participants file
     with open(f"MMC/mmc{mmc}/participants.json", "r") as file:
@@ -163,10 +154,9 @@ def insertData(c: sqlite3.Cursor, conn: sqlite3.Connection) -> None:
             try:
                 name = p["name"]
                 # get data from names csv                
-                namesData = namesFile[namesFile["Name"] == name]
-                ind: int = namesData.index[0]
-                normalName = namesFile["Normal Name"][ind]
-                playerRaces[name] = [namesFile["Race"][ind], namesFile["OffRace"][ind]]
+                namesData = namesFile[name]
+                normalName = namesData["Normal Name"]
+                playerRaces[name] = [namesData["Race"], namesData["OffRace"]]
                 participantID[str(p["id"])] = name
 
                 # insert data into ChallongeNames
@@ -175,7 +165,7 @@ def insertData(c: sqlite3.Cursor, conn: sqlite3.Connection) -> None:
                 # if the results are empty, we need to add that person into the table
                 if len(results) == 0:               
                     # entry for ChallongeNames
-                    cnames = (str(namesFile["Name"][ind]), str(namesFile["Normal Name"][ind]))
+                    cnames = (namesData["Name"], namesData["Normal Name"])
                     c.executemany("INSERT INTO ChallongeNames VALUES (?,?)", (cnames,))
                     conn.commit()
                 
@@ -185,7 +175,7 @@ def insertData(c: sqlite3.Cursor, conn: sqlite3.Connection) -> None:
                 # the results are empty, we need to add that person into the table
                 if len(results) == 0:
                     # entry for Player
-                    player: Tuple[str] = (str(namesFile["Normal Name"][ind]), str(namesFile["Race"][ind]), str(namesFile["Country"][ind]), str(namesFile["Team"][ind]), str(namesFile["OffRace"][ind]))
+                    player: Tuple[str] = (namesData["Normal Name"], namesData["Race"], namesData["Country"], namesData["Team"], namesData["OffRace"])
                     c.executemany("INSERT INTO Player VALUES (?,?,?,?,?)", (player,))
                     conn.commit()
                 
@@ -198,8 +188,8 @@ def insertData(c: sqlite3.Cursor, conn: sqlite3.Connection) -> None:
                     participant = (str(p["id"]), str(p["name"]), str(p["challonge_user_id"]), str(p["tournament_id"]))
                     c.executemany("INSERT INTO Participants VALUES (?,?,?,?)", (participant,))
                     conn.commit()
-            except:
-                print(f"{name} was not added")
+            except (KeyError, sqlite3.Error) as e:
+                print(f"{name} was not added: {e}")
         print("Finished entering participant data")
     
     # data to be pulled from matches file
@@ -254,32 +244,51 @@ def insertData(c: sqlite3.Cursor, conn: sqlite3.Connection) -> None:
     
     return
 
-def main() -> None:
-    # connect to db
-    conn: sqlite3.Connection = connect()
-    # create a cursor
-    c: sqlite3.Cursor = conn.cursor()
-
+def main(mmc: int, pullData: bool=True, dbName: str="mmc.db") -> int:
+    """
+    Function for adding a single MMC to the database
+    :param mmc: the edition of MMC to add
+    :param pullData: if the data needs to be pulled from challonge first, set to True. Set to False if the json files are already in the MMC folder
+    :param dbName: the sqlite database file to add to
+    :returns: 0 if the data was added, 1 if the MMC has no matches yet or there are new names that need to be added to Names.csv first
+    """
     # add the MMC to pull data for
-    print("Pulling MMC Data")
-    pullMMCData()
-    print("Finished Pulling MMC Data")
+    if pullData:
+        print("Pulling MMC Data")
+        pullMMCData(mmc)
+        print("Finished Pulling MMC Data")
+
+    # an MMC that hasn't started yet has no matches, nothing is added until it has been played (the same as createMMCDB skips it)
+    with open(f"MMC/mmc{mmc}/matches.json", "r") as file:
+        if len(json.loads(file.read())) == 0:
+            print(f"MMC {mmc} has no matches yet, nothing was added")
+            return 1
     
     # check for new challonge usernames
     print("Checking for new names")
-    newChallongeNames(c, conn)
+    newNames: List[str] = newChallongeNames(mmc)
+    if newNames:
+        for name in newNames:
+            print(name)
+        print("Add these names to Names.csv and run again")
+        return 1
     print("Finished checking for new names")
     
+    # connect to db
+    conn: sqlite3.Connection = connect(dbName)
+    # create a cursor
+    c: sqlite3.Cursor = conn.cursor()
+
     # insert new data
-    insertData(c, conn)
+    insertData(c, conn, mmc)
 
     print("Data Included")
     conn.close()
+    return 0
 
 
 
 if __name__ == "__main__":
-    try:
-        main()
-    except:
-        exit(1)
\ No newline at end of file
+    from mmcStats import main as cli
+    import sys
+    exit(cli(["add"] + sys.argv[1:]))
\ No newline at end of file
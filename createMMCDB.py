@@ -1,18 +1,16 @@
 import sqlite3
 from typing import Dict, List, Set, Tuple
-import pandas as pd
 import json
-import challonge
+import csv
 import datetime
 import os
-from credentials import userID, apiKey
+import re
 
 players: List[Tuple] = [] # for storing player tuples to be put into the Player table in mmc.db
 challongeNames: List[Tuple] = [] # for storing player challonge name tuples to be put into the ChallongeNames table in mmc.db 
 mmc: List[Tuple] = [] # for storing the mmc tuples to be put into the MMC table in mmc.db
 participants: List[Tuple] = [] # for storing the participant tuples to be put into the Participants table in mmc.db
 matches: List[Tuple] = [] # for storing the matches tuples to be put into the Matches table in mmc.db
-numOfMMC: int = 104 # the number of MMC's that have happend. Last updated September 10, 2024
 playerRaces: Dict[str,List[str]] = dict() # for being able to reference a players race/offrace when inputing match data. List has main race first and offrace second
 participantID: Dict[str, str] = dict() # for quick referencing a player name with their ID
 
@@ -23,6 +21,36 @@ def connect(dbName: str="mmc.db") -> sqlite3.Connection:
     """
     return sqlite3.connect(dbName)
 
+def discoverEditions(folder: str="MMC") -> List[int]:
+    """
+    Function for finding every MMC that has data saved in the MMC folder
+    An edition counts once both its participants.json and matches.json files exist
+    :param folder: the folder holding the mmc# folders
+    :returns: a sorted list of the edition numbers
+    """
+    editions: List[int] = []
+    for entry in os.listdir(folder):
+        found = re.fullmatch(r"mmc(\d+)", entry)
+        if found and os.path.exists(f"{folder}/{entry}/participants.json") and os.path.exists(f"{folder}/{entry}/matches.json"):
+            editions.append(int(found.group(1)))
+    editions.sort()
+    return editions
+
+def readNames(fileName: str="Names.csv") -> List[Dict[str, str]]:
+    """
+    Function for reading the Names.csv file without needing pandas
+    Blank and NULL cells are read as "nan", the same as they have always been stored in mmc.db
+    :param fileName: the names file, utf-16 encoded and tab delimited
+    :returns: a list with a dictionary for every row, keyed by column name
+    """
+    with open(fileName, "r", encoding="utf-16", newline="") as file:
+        rows = list(csv.DictReader(file, delimiter="\t"))
+    for row in rows:
+        for key, value in row.items():
+            if value in ("", "NULL"):
+                row[key] = "nan"
+    return rows
+
 def pullMMCData() -> None:
     """
     Optional function used for repulling the data from all MMC's using the challonge API
@@ -30,23 +58,31 @@ def pullMMCData() -> None:
     This function will go through and add all Matches and Participant data from the challonge website
     and put it into the `MMC` folder. 
     """
+    # challonge and the credentials are only needed here, so they are not imported when rebuilding from the json files
+    import challonge
+    from credentials import userID, apiKey
     # set challonge credentials
     challonge.set_credentials(userID, apiKey)
     # query the api for an index of all tournaments associated with the challonge account
     tournaments = challonge.tournaments.index()
 
     # query the api for the data for every mmc that has occured
-    for edition in range(1, numOfMMC + 1):
-        # get the id of current mmc in the loop
-        for t in tournaments:
-            if t["url"] == f"MagikarpMastersCup{edition}":
-                tournamentID = t["id"]
-        
-        # try making the specific folder for the current loops mmc data
-        try:
-            os.mkdir(f"MMC/mmc{edition}")
-        except:
-            pass
+    for t in tournaments:
+        found = re.fullmatch(r"MagikarpMastersCup(\d+)", t["url"])
+        if not found:
+            continue
+        edition: int = int(found.group(1))
+        tournamentID = t["id"]
+
+        # get all the matches from a specific tournament
+        matches = challonge.matches.index(tournamentID)
+        # tournaments that haven't started yet (still taking sign ups) have no matches, so there is nothing to save
+        if len(matches) == 0:
+            print(f"MMC {edition} has no matches yet, skipping it")
+            continue
+
+        # make the specific folder for the current loops mmc data if it doesn't exist yet
+        os.makedirs(f"MMC/mmc{edition}", exist_ok=True)
 
         # get the participant data
         with open(f"MMC/mmc{edition}/participants.json", "w") as outfile:
@@ -62,8 +98,6 @@ def pullMMCData() -> None:
             outfile.write(json.dumps(participants, indent=4))
         # get the match data
         with open(f"MMC/mmc{edition}/matches.json", "w") as outfile:
-            # get all the matches from a specific tournament
-            matches = challonge.matches.index(tournamentID)
             # fix the date data for each match as sqlite does not support the format challonge writes it in
             for m in matches:
                 for key in m.keys():
@@ -173,27 +207,27 @@ def createTables(c: sqlite3.Cursor, conn: sqlite3.Connection) -> None:
     print("Finished Creating Tables")
     return
 
-def preparePlayerData(names: pd.DataFrame) -> None:
+def preparePlayerData(names: List[Dict[str, str]]) -> None:
     """
     Function that uses the Names.csv file to store all relevant data for players like name, race, country, etc.
     Also prepare data for attaching a players standarized name with their challonge username(s)
-    :param names: a pandas dataframe that holds everyones name info
+    :param names: the rows of Names.csv from readNames that hold everyones name info
     """
     print("Preparing Player Data")
     # keep track of which players have been seen so that no one is added multiple times
     playersSeen: Set[str] = set()
     # go through each name
-    for ind in names.index:
+    for row in names:
         # Add each challonge username with standardized name
-        challongeNames.append((str(names["Name"][ind]), str(names["Normal Name"][ind])))
+        challongeNames.append((row["Name"], row["Normal Name"]))
         # if a player has not been added for the Player table, do so
-        if names["Normal Name"][ind] not in playersSeen:
+        if row["Normal Name"] not in playersSeen:
             # add theh name to names seen
-            playersSeen.add(names["Normal Name"][ind])
-            newPlayer: Tuple[str] = (str(names["Normal Name"][ind]), str(names["Race"][ind]), str(names["Country"][ind]), str(names["Team"][ind]), str(names["OffRace"][ind]))
+            playersSeen.add(row["Normal Name"])
+            newPlayer: Tuple[str] = (row["Normal Name"], row["Race"], row["Country"], row["Team"], row["OffRace"])
             players.append(newPlayer)
         # update the playerRaces dict
-        playerRaces[names["Name"][ind]] = [names["Race"][ind],names["OffRace"]]
+        playerRaces[row["Name"]] = [row["Race"], row["OffRace"]]
 
     print("Finished Preparing Player Data")
     return
@@ -396,15 +430,18 @@ def scoreFix(score: str) -> Tuple[int, int]:
 
     return winner, loser
 
-def main() -> None:
-    # if the data needs to be repulled from challonge, set to True
-    repullData = False
+def main(repullData: bool=False, dbName: str="mmc.db") -> None:
+    """
+    Function for creating the database from the json files in the MMC folder
+    :param repullData: if the data needs to be repulled from challonge first, set to True
+    :param dbName: the sqlite database file to create
+    """
     if repullData:
         pullMMCData()
     # if you need to remake the database due to a change in the data, set to True
     startFromScratch: bool = True
     # connect to db
-    conn: sqlite3.Connection = connect()
+    conn: sqlite3.Connection = connect(dbName)
     # create a cursor
     c: sqlite3.Cursor = conn.cursor()
     
@@ -413,13 +450,13 @@ def main() -> None:
         createTables(c, conn)    
     
         # load in the names
-        names: pd.DataFrame = pd.read_csv("Names.csv",encoding="utf-16",delimiter="\t")
+        names: List[Dict[str, str]] = readNames()
         
         # prepare data for player table
         preparePlayerData(names)
         
-        # input data from MMC's
-        for edition in range(1, numOfMMC + 1):
+        # input data from every MMC saved in the MMC folder
+        for edition in discoverEditions():
             print(edition)
             # load data from json files
             matchesFile = open(f"MMC/mmc{edition}/matches.json", "r")
@@ -428,6 +465,10 @@ def main() -> None:
             partsData = json.loads(partsFile.read())
             matchesFile.close()
             partsFile.close()
+            # an MMC that hasn't started yet has no matches and can't be added until it has been played
+            if len(matchesData) == 0:
+                print(f"MMC {edition} has no matches yet, skipping it")
+                continue
             
             # data for MMC table
             tournamentID: str = str(matchesData[0]["tournament_id"])
@@ -454,7 +495,4 @@ def main() -> None:
     conn.close()
 
 if __name__ == "__main__":
-    try:
-        main()
-    except:
-        exit(1)
\ No newline at end of file
+    main()
\ No newline at end of file
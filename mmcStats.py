@@ -0,0 +1,180 @@
+import argparse
+import sys
+from typing import Dict, List, Tuple
+
+# the modules each subcommand imports, the handlers below import exactly these so `bench` measures what a real run pays for.
+# Everything heavy (numpy, challonge, credentials) is imported inside the handler that needs it, never at the top of this file
+commandImports: Dict[str, str] = {
+    "rebuild": "import createMMCDB",
+    "add": "import addMMC",
+    "query": "import queries",
+    "predict": "import predictBracket",
+    "graph": "import playerGraph",
+    "report": "import reports",
+}
+# challonge and credentials.py are only imported once data is pulled (add without --local, rebuild --repull), so they are timed on their own
+pullImports: Dict[str, str] = {
+    "add/rebuild pulling from challonge": "import addMMC, challonge, credentials",
+}
+
+def rebuild(args: argparse.Namespace) -> int:
+    """
+    Subcommand for creating the database from the json files in the MMC folder
+    Challonge and credentials.py are only needed if --repull is given
+    """
+    import createMMCDB
+    createMMCDB.main(args.repull, args.db)
+    return 0
+
+def add(args: argparse.Namespace) -> int:
+    """
+    Subcommand for adding a single MMC to the database, pulling it from challonge first unless --local is given
+    """
+    import addMMC
+    try:
+        return addMMC.main(args.edition, not args.local, args.db)
+    except ModuleNotFoundError as e:
+        if e.name not in ("challonge", "credentials"):
+            raise
+        print(f"Pulling from challonge needs {e.name} ({e}). Use --local if MMC/mmc{args.edition} is already saved")
+        return 1
+
+def query(args: argparse.Namespace) -> int:
+    """
+    Subcommand for running one of the stats queries against the database
+    """
+    import queries
+    if args.kind == "mmcs":
+        queries.numberOfMMC(args.names[0], args.db)
+    elif args.kind == "record":
+        queries.winLossRecord(args.names[0], args.db)
+    elif args.kind == "history":
+        queries.matchHistory(args.names[0], args.names[1], args.db)
+    else:
+        queries.generalRaceStatistics(args.db)
+    return 0
+
+def predict(args: argparse.Namespace) -> int:
+    """
+    Subcommand for predicting the results of an MMC, see predictBracket.py
+    """
+    import predictBracket
+    predictBracket.showPredictions(args.edition, args.runs, args.workers, args.seed, args.db)
+    return 0
+
+def graph(args: argparse.Namespace) -> int:
+    """
+    Subcommand for the player graph queries, see playerGraph.py
+    """
+    import playerGraph
+    playerGraph.showGraphQuery(args.kind, args.names, args.db, args.top)
+    return 0
+
+def report(args: argparse.Namespace) -> int:
+    """
+    Subcommand for generating the stats pages of every player and MMC, see reports.py
+    """
+    import reports
+    written, skipped = reports.generateReports(args.db, args.out, args.workers, args.force)
+    print(f"Reports written: {written} | Unchanged: {skipped}")
+    return 0
+
+def importTime(statement: str, repeat: int) -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    Function for measuring how long python takes to import what a statement imports, using `python -X importtime`
+    The fastest of the repeats is kept so that a cold disk cache on the first run doesn't skew the result
+    :param statement: the python code to time, like "import createMMCDB"
+    :param repeat: how many times to run it
+    :returns: a tuple of the total import time in milliseconds and the (module, milliseconds) of every top level import, slowest first
+    """
+    import subprocess
+    import os
+    best: Tuple[float, List[Tuple[str, float]]] = None
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+        modules: List[Tuple[str, float]] = []
+        # lines look like "import time:       512 |       1024 | module", nested imports have extra spaces before the module name
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, module = line.split("|")
+            if not module.startswith("  "):
+                modules.append((module.strip(), int(cumulative) / 1000))
+        total: float = sum(ms for _, ms in modules)
+        if best is None or total < best[0]:
+            modules.sort(key=lambda m: m[1], reverse=True)
+            best = (total, modules)
+    return best
+
+def bench(args: argparse.Namespace) -> int:
+    """
+    Subcommand for measuring the startup import time of every subcommand
+    """
+    baseline, _ = importTime("pass", args.repeat)
+    print(f"python itself: {round(baseline, 1)} ms")
+    for command, statement in list(commandImports.items()) + list(pullImports.items()):
+        try:
+            total, modules = importTime(f"import mmcStats; {statement}", args.repeat)
+        except RuntimeError as e:
+            print(f"{command}: could not be timed, {e}")
+            continue
+        slowest = ", ".join(f"{module} {round(ms, 1)} ms" for module, ms in modules[:3])
+        print(f"{command}: {round(total, 1)} ms ({round(total - baseline, 1)} ms over python) | Slowest: {slowest}")
+    return 0
+
+def main(argv: List[str]=None) -> int:
+    parser = argparse.ArgumentParser(description="Build and query the MMC stats database")
+    parser.add_argument("--db", default="mmc.db", help="the sqlite database file to use, default is mmc.db")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    rebuildParser = subcommands.add_parser("rebuild", help="create the database from every MMC saved in the MMC folder")
+    rebuildParser.add_argument("--repull", action="store_true", help="pull every MMC from challonge again first")
+    rebuildParser.set_defaults(handler=rebuild)
+
+    addParser = subcommands.add_parser("add", help="add a single MMC to the database")
+    addParser.add_argument("edition", type=int, help="the MMC edition to add")
+    addParser.add_argument("--local", action="store_true", help="use the json files already in the MMC folder instead of pulling from challonge")
+    addParser.set_defaults(handler=add)
+
+    queryParser = subcommands.add_parser("query", help="print stats from the database")
+    queryParser.add_argument("kind", choices=["mmcs", "record", "history", "races"],
+                             help="mmcs NAME: editions played, record NAME: win/loss record, history NAME1 NAME2: match history, races: race matchups")
+    queryParser.add_argument("names", nargs="*", help="the standardized player name(s) the query is for")
+    queryParser.set_defaults(handler=query)
+
+    predictParser = subcommands.add_parser("predict", help="predict the results of an MMC by simulating its bracket")
+    predictParser.add_argument("edition", type=int, help="the MMC edition to predict")
+    predictParser.add_argument("--runs", type=int, default=100000, help="how many times to simulate the bracket")
+    predictParser.add_argument("--workers", type=int, default=None, help="how many processes to use, default is one per cpu")
+    predictParser.add_argument("--seed", type=int, default=None, help="seed for the random number generator")
+    predictParser.set_defaults(handler=predict)
+
+    graphParser = subcommands.add_parser("graph", help="query the graph of who has beaten who")
+    graphParser.add_argument("kind", choices=["common", "chain", "strength", "schedule"],
+                             help="common NAME1 NAME2: common opponents, chain NAME1 NAME2: shortest chain of wins, strength: strongest players, schedule NAME: strength of schedule")
+    graphParser.add_argument("names", nargs="*", help="the standardized player name(s) the query is for")
+    graphParser.add_argument("--top", type=int, default=20, help="how many players to print for strength")
+    graphParser.set_defaults(handler=graph)
+
+    reportParser = subcommands.add_parser("report", help="generate html and json stats pages for every player and MMC")
+    reportParser.add_argument("--out", default="reports", help="the folder the pages go in, default is reports")
+    reportParser.add_argument("--workers", type=int, default=None, help="how many processes to use, default is one per cpu")
+    reportParser.add_argument("--force", action="store_true", help="render every page even if it has not changed")
+    reportParser.set_defaults(handler=report)
+
+    benchParser = subcommands.add_parser("bench", help="measure the startup import time of every subcommand with -X importtime")
+    benchParser.add_argument("--repeat", type=int, default=5, help="how many times to time each subcommand, the fastest is kept")
+    benchParser.set_defaults(handler=bench)
+
+    args = parser.parse_args(argv)
+    if args.command in ("query", "graph"):
+        needed: int = {"mmcs": 1, "record": 1, "history": 2, "races": 0, "common": 2, "chain": 2, "strength": 0, "schedule": 1}[args.kind]
+        if len(args.names) != needed:
+            parser.error(f"{args.command} {args.kind} needs {needed} name(s)")
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+import sqlite3
+from typing import Dict, List, Tuple
+import os
+import hashlib
+import numpy as np
+
+def connect(dbName: str="mmc.db") -> sqlite3.Connection:
+    """
+    Function for connecting to a specific database.
+    Default is mmc.db
+    """
+    return sqlite3.connect(dbName)
+
+def graphSignature(c: sqlite3.Cursor) -> str:
+    """
+    Function for describing which data the graph was built from
+    If the signature of the database changes (a new MMC was added, or the database was rebuilt with different challonge names) the cached graph is rebuilt
+    :param c: sqlite3 cursor
+    :returns: a string of every MMC number in the database, the number of matches, and the number and a hash of the challonge names
+    """
+    c.execute("SELECT NUMBER FROM MMC ORDER BY NUMBER")
+    editions = [str(r[0]) for r in c.fetchall()]
+    c.execute("SELECT COUNT(*) FROM Matches")
+    numMatches: int = c.fetchone()[0]
+    # which standardized name each challonge account resolves to
+    c.execute("SELECT CNAME, NAME FROM ChallongeNames ORDER BY CNAME")
+    cnames = c.fetchall()
+    cnamesHash: str = hashlib.sha1("\n".join(f"{cname}\t{name}" for cname, name in cnames).encode("utf-8")).hexdigest()
+    return f"{','.join(editions)}:{numMatches}:{len(cnames)}:{cnamesHash}"
+
+def toCSR(rows: np.ndarray, columns: np.ndarray, numPlayers: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Function for turning a list of edges into a compressed sparse row adjacency
+    Repeated edges are merged and counted, so the count is the number of times row beat (or lost to) column
+    :param rows: the player each edge starts at
+    :param columns: the player each edge ends at
+    :param numPlayers: the number of players in the graph
+    :returns: a tuple of the row pointers, the column of every edge and the count of every edge.
+    The neighbours of player i are columns[pointers[i]:pointers[i + 1]]
+    """
+    # merge repeated edges by giving every (row, column) pair a single number
+    edges, counts = np.unique(rows * numPlayers + columns, return_counts=True)
+    edgeRows = edges // numPlayers
+    pointers = np.zeros(numPlayers + 1, dtype=np.int64)
+    pointers[1:] = np.cumsum(np.bincount(edgeRows, minlength=numPlayers))
+    return pointers, edges % numPlayers, counts
+
+def buildGraph(c: sqlite3.Cursor) -> Dict[str, np.ndarray]:
+    """
+    Function for building the win/loss graph of every player from the Matches table
+    Challonge ids are resolved to standardized player names so that every account a player has used is the same player
+    Walkovers are left out as no game was played
+    :param c: sqlite3 cursor
+    :returns: a dictionary of numpy arrays holding the player names, the beat graph (winner to loser), the lost graph (loser to winner) and the signature of the data
+    """
+    c.execute("""
+              SELECT wn.NAME, ln.NAME
+              FROM Matches m
+              JOIN Participants wp ON wp.CHALLONGEID = m.WINNERID
+              JOIN ChallongeNames wn ON wn.CNAME = wp.CNAME
+              JOIN Participants lp ON lp.CHALLONGEID = m.LOSERID
+              JOIN ChallongeNames ln ON ln.CNAME = lp.CNAME
+              WHERE m.LOSERSCORE >= 0
+              """)
+    results = c.fetchall()
+    names = np.array(sorted(set(r[0] for r in results) | set(r[1] for r in results)))
+    winners = np.searchsorted(names, [r[0] for r in results])
+    losers = np.searchsorted(names, [r[1] for r in results])
+    beatPtr, beatIdx, beatCount = toCSR(winners, losers, len(names))
+    lostPtr, lostIdx, lostCount = toCSR(losers, winners, len(names))
+    return {"names": names, "beatPtr": beatPtr, "beatIdx": beatIdx, "beatCount": beatCount,
+            "lostPtr": lostPtr, "lostIdx": lostIdx, "lostCount": lostCount, "signature": np.array(graphSignature(c))}
+
+def loadGraph(dbName: str="mmc.db", cacheFile: str=None) -> Dict[str, np.ndarray]:
+    """
+    Function for loading the player graph, using the copy saved on disk if the database has not changed since it was made
+    :param dbName: the sqlite database file to build the graph from
+    :param cacheFile: where the graph is saved between runs, default is next to the database (mmc.playerGraph.npz for mmc.db)
+    :returns: the graph, see buildGraph
+    """
+    # every database gets its own cache so using --db doesn't throw away the graph of another database
+    cacheFile = cacheFile or f"{os.path.splitext(dbName)[0]}.playerGraph.npz"
+    conn: sqlite3.Connection = connect(dbName)
+    c: sqlite3.Cursor = conn.cursor()
+    signature: str = graphSignature(c)
+    if os.path.exists(cacheFile):
+        with np.load(cacheFile) as cached:
+            if str(cached["signature"]) == signature:
+                conn.close()
+                return dict(cached)
+    graph = buildGraph(c)
+    conn.close()
+    np.savez(cacheFile, **graph)
+    return graph
+
+def playerIndex(graph: Dict[str, np.ndarray], name: str) -> int:
+    """
+    Function for finding a players position in the graph
+    :param graph: the graph from loadGraph
+    :param name: the standardized name of the player
+    :returns: the index of the player, or -1 if they have never played a match
+    """
+    i: int = int(np.searchsorted(graph["names"], name))
+    if i < len(graph["names"]) and graph["names"][i] == name:
+        return i
+    return -1
+
+def row(graph: Dict[str, np.ndarray], kind: str, player: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Function for getting the neighbours of a player
+    :param graph: the graph from loadGraph
+    :param kind: beat for the players they have beaten, lost for the players they have lost to
+    :param player: the index of the player
+    :returns: a tuple of the neighbour indexes and how many times it happened
+    """
+    pointers = graph[f"{kind}Ptr"]
+    start, end = pointers[player], pointers[player + 1]
+    return graph[f"{kind}Idx"][start:end], graph[f"{kind}Count"][start:end]
+
+def beatenByBoth(graph: Dict[str, np.ndarray], first: int, second: int) -> np.ndarray:
+    """
+    Function for finding every player that two players have both beaten
+    :param graph: the graph from loadGraph
+    :param first: the index of the first player
+    :param second: the index of the second player
+    :returns: the indexes of the players both have beaten
+    """
+    # the columns of each row are sorted, so the intersection can skip sorting again
+    return np.intersect1d(row(graph, "beat", first)[0], row(graph, "beat", second)[0], assume_unique=True)
+
+def commonOpponents(graph: Dict[str, np.ndarray], first: int, second: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Function for finding every player that two players have both played, along with each of their records against them
+    :param graph: the graph from loadGraph
+    :param first: the index of the first player
+    :param second: the index of the second player
+    :returns: a tuple of the indexes of the common opponents, and the wins and losses of each player against them.
+    The records have a row for the first player and a row for the second
+    """
+    numPlayers: int = len(graph["names"])
+    wins = np.zeros((2, numPlayers), dtype=np.int64)
+    losses = np.zeros((2, numPlayers), dtype=np.int64)
+    for side, player in enumerate((first, second)):
+        beaten, count = row(graph, "beat", player)
+        wins[side, beaten] = count
+        lostTo, count = row(graph, "lost", player)
+        losses[side, lostTo] = count
+    played = (wins + losses) > 0
+    opponents = np.flatnonzero(played[0] & played[1])
+    return opponents, wins[:, opponents], losses[:, opponents]
+
+def beatChain(graph: Dict[str, np.ndarray], start: int, end: int) -> List[int]:
+    """
+    Function for finding the shortest chain of wins from one player to another, A beat B who beat C and so on
+    A breadth first search that expands the whole frontier at once instead of one player at a time
+    :param graph: the graph from loadGraph
+    :param start: the index of the player the chain starts at
+    :param end: the index of the player the chain ends at
+    :returns: the indexes of the players in the chain from start to end, or an empty list if there is no chain
+    """
+    pointers, columns = graph["beatPtr"], graph["beatIdx"]
+    parent = np.full(len(graph["names"]), -1, dtype=np.int64)
+    parent[start] = start
+    frontier = np.array([start])
+    while len(frontier) > 0 and parent[end] == -1:
+        # gather the neighbours of every player in the frontier in one go
+        lengths = pointers[frontier + 1] - pointers[frontier]
+        offsets = np.repeat(pointers[frontier] - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        neighbours = columns[offsets]
+        sources = np.repeat(frontier, lengths)
+        new = parent[neighbours] == -1
+        neighbours, sources = neighbours[new], sources[new]
+        # a player reached from more than one source only keeps the first
+        neighbours, first = np.unique(neighbours, return_index=True)
+        parent[neighbours] = sources[first]
+        frontier = neighbours
+    if parent[end] == -1:
+        return []
+    chain: List[int] = [end]
+    while chain[-1] != start:
+        chain.append(int(parent[chain[-1]]))
+    chain.reverse()
+    return chain
+
+def strength(graph: Dict[str, np.ndarray], damping: float=0.85, iterations: int=100) -> np.ndarray:
+    """
+    Function for rating every player with PageRank, where every loss is a vote for the player who won
+    Beating players who have beaten a lot of other players is worth more than beating players who rarely win
+    :param graph: the graph from loadGraph
+    :param damping: the chance of following a loss instead of jumping to a random player
+    :param iterations: how many update steps to take
+    :returns: a numpy array with the strength of every player, adding up to 1
+    """
+    numPlayers: int = len(graph["names"])
+    pointers, columns, counts = graph["lostPtr"], graph["lostIdx"], graph["lostCount"]
+    sources = np.repeat(np.arange(numPlayers), np.diff(pointers))
+    totalLosses = np.bincount(sources, counts, numPlayers)
+    # players who have never lost share their vote with everyone
+    unbeaten = totalLosses == 0
+    weights = counts / totalLosses[sources]
+    rank = np.full(numPlayers, 1 / numPlayers)
+    for _ in range(iterations):
+        shared: float = rank[unbeaten].sum() / numPlayers
+        rank = (1 - damping) / numPlayers + damping * (np.bincount(columns, rank[sources] * weights, numPlayers) + shared)
+    return rank
+
+def scheduleStrength(graph: Dict[str, np.ndarray], ranks: np.ndarray) -> np.ndarray:
+    """
+    Function for working out the strength of schedule of every player, the average strength of every opponent they have played
+    :param graph: the graph from loadGraph
+    :param ranks: the strength of every player from strength
+    :returns: a numpy array with the strength of schedule of every player
+    """
+    numPlayers: int = len(graph["names"])
+    total = np.zeros(numPlayers)
+    games = np.zeros(numPlayers)
+    for kind in ("beat", "lost"):
+        sources = np.repeat(np.arange(numPlayers), np.diff(graph[f"{kind}Ptr"]))
+        total += np.bincount(sources, ranks[graph[f"{kind}Idx"]] * graph[f"{kind}Count"], numPlayers)
+        games += np.bincount(sources, graph[f"{kind}Count"], numPlayers)
+    return total / np.maximum(games, 1)
+
+def showGraphQuery(kind: str, names: List[str], dbName: str="mmc.db", top: int=20) -> None:
+    """
+    Function for printing the result of a graph query
+    :param kind: common NAME1 NAME2, chain NAME1 NAME2, strength, or schedule NAME
+    :param names: the standardized player name(s) the query is for
+    :param dbName: the sqlite database file to use
+    :param top: how many players to print for the strength query
+    """
+    graph = loadGraph(dbName)
+    players = [playerIndex(graph, name) for name in names]
+    for name, player in zip(names, players):
+        if player == -1:
+            print(f"{name} has never played a match in MMC")
+            return
+    playerNames = graph["names"]
+
+    if kind == "common":
+        beaten = beatenByBoth(graph, players[0], players[1])
+        print(f"Players both {names[0]} and {names[1]} have beaten: {len(beaten)}")
+        print(", ".join(playerNames[beaten]))
+        opponents, wins, losses = commonOpponents(graph, players[0], players[1])
+        print(f"Common opponents: {len(opponents)}")
+        for i, opponent in enumerate(opponents):
+            print(f"{playerNames[opponent]}: {names[0]} {wins[0, i]}-{losses[0, i]} | {names[1]} {wins[1, i]}-{losses[1, i]}")
+    elif kind == "chain":
+        chain = beatChain(graph, players[0], players[1])
+        if chain:
+            print(" beat ".join(playerNames[chain]))
+        else:
+            print(f"There is no chain of wins from {names[0]} to {names[1]}")
+    else:
+        # scale so that an average player has a strength of 1
+        ranks = strength(graph) * len(playerNames)
+        schedule = scheduleStrength(graph, ranks)
+        if kind == "strength":
+            for place, player in enumerate(np.argsort(-ranks)[:top]):
+                print(f"{place + 1}. {playerNames[player]} | Strength: {round(ranks[player], 2)} | Schedule: {round(schedule[player], 2)}")
+        else:
+            place: int = int(np.sum(schedule > schedule[players[0]])) + 1
+            print(f"{names[0]} Strength: {round(ranks[players[0]], 2)} | Strength of Schedule: {round(schedule[players[0]], 2)} | Schedule Rank: {place} of {len(playerNames)}")
+    return
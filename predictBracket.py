@@ -0,0 +1,387 @@
+import sqlite3
+from typing import Dict, List, Tuple
+import os
+import json
+import argparse
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+races: List[str] = ["p", "t", "z", "r"] # races with a matchup prior, anything else (like nan) is treated as unknown
+ENTRANT: int = 0 # slot filled directly by a seeded player
+WINNEROF: int = 1 # slot filled by the winner of an earlier match
+LOSEROF: int = 2 # slot filled by the loser of an earlier match (double elimination drop downs)
+
+def connect(dbName: str="mmc.db") -> sqlite3.Connection:
+    """
+    Function for connecting to a specific database.
+    Default is mmc.db
+    """
+    return sqlite3.connect(dbName)
+
+def raceIndex(race: str) -> int:
+    """
+    Function for turning a race letter into a row of the race matchup prior
+    :param race: the race letter stored in the Player and Matches tables
+    :returns: the index of the race in `races`, or len(races) if the race is unknown
+    """
+    if race in races:
+        return races.index(race)
+    return len(races)
+
+def loadHistory(c: sqlite3.Cursor, beforeEdition: int) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Function for pulling every decided match played before a specific edition out of mmc.db
+    Challonge ids are resolved to standardized player names so that every account a player has used counts towards the same rating
+    Walkovers are left out as they say nothing about how strong a player is
+    :param c: sqlite3 cursor
+    :param beforeEdition: only matches from MMC's with a lower number than this are used
+    :returns: a tuple of the player names followed by numpy arrays of the winner index, loser index, winner race index and loser race index of every match
+    """
+    c.execute("""
+              SELECT wn.NAME, ln.NAME, m.WINNERRACE, m.LOSERRACE
+              FROM Matches m
+              JOIN MMC ON MMC.TOURNAMENTID = m.TOURNAMENTID
+              JOIN Participants wp ON wp.CHALLONGEID = m.WINNERID
+              JOIN ChallongeNames wn ON wn.CNAME = wp.CNAME
+              JOIN Participants lp ON lp.CHALLONGEID = m.LOSERID
+              JOIN ChallongeNames ln ON ln.CNAME = lp.CNAME
+              WHERE MMC.NUMBER < ? AND m.LOSERSCORE >= 0
+              """, (beforeEdition,))
+    results = c.fetchall()
+    names: List[str] = []
+    index: Dict[str, int] = dict() # for quick referencing a players position in names
+    for r in results:
+        for name in (r[0], r[1]):
+            if name not in index:
+                index[name] = len(names)
+                names.append(name)
+    winners = np.array([index[r[0]] for r in results], dtype=np.int64)
+    losers = np.array([index[r[1]] for r in results], dtype=np.int64)
+    winnerRaces = np.array([raceIndex(r[2]) for r in results], dtype=np.int64)
+    loserRaces = np.array([raceIndex(r[3]) for r in results], dtype=np.int64)
+    return names, winners, losers, winnerRaces, loserRaces
+
+def racePrior(winnerRaces: np.ndarray, loserRaces: np.ndarray) -> np.ndarray:
+    """
+    Function for estimating how much each race matchup favours one side
+    Uses the smoothed win rate of every race against every other race, the same numbers generalRaceStatistics prints
+    :param winnerRaces: race index of the winner of every match
+    :param loserRaces: race index of the loser of every match
+    :returns: a square numpy array of log-odds, row race against column race. The unknown race row and column are 0
+    """
+    size: int = len(races) + 1
+    wins = np.zeros((size, size))
+    np.add.at(wins, (winnerRaces, loserRaces), 1)
+    # add one win for each side so that rare matchups (like RvR) stay close to even
+    prior = np.log((wins + 1) / (wins.T + 1))
+    prior[len(races), :] = 0
+    prior[:, len(races)] = 0
+    return prior
+
+def fitRatings(numPlayers: int, winners: np.ndarray, losers: np.ndarray, matchup: np.ndarray, iterations: int=200, regularization: float=1.0) -> np.ndarray:
+    """
+    Function for fitting a Bradley-Terry style rating for every player
+    The chance of a winning is sigmoid(rating difference + race matchup prior)
+    Ratings are pulled towards 0 so players with only a few matches are not rated too high or low
+    :param numPlayers: the number of players being rated
+    :param winners: index of the winner of every match
+    :param losers: index of the loser of every match
+    :param matchup: the race matchup log-odds for every match, from the winners point of view
+    :param iterations: how many update steps to take
+    :param regularization: how strongly ratings are pulled towards 0
+    :returns: a numpy array with the rating of every player
+    """
+    ratings = np.zeros(numPlayers)
+    games = np.bincount(winners, minlength=numPlayers) + np.bincount(losers, minlength=numPlayers)
+    # each game adds at most 0.25 to the curvature, so this keeps the steps from overshooting
+    step = 1 / (0.25 * games + regularization)
+    for _ in range(iterations):
+        surprise = 1 - 1 / (1 + np.exp(-(ratings[winners] - ratings[losers] + matchup)))
+        gradient = np.bincount(winners, surprise, numPlayers) - np.bincount(losers, surprise, numPlayers) - regularization * ratings
+        ratings += step * gradient
+    return ratings
+
+def loadBracket(edition: int) -> Tuple[List[str], str, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Function for loading the bracket of a specific MMC from the MMC folder
+    If the matches.json file exists, the bracket challonge made is used as is, so both single and double elimination work.
+    If only participants.json exists or matches.json is empty (the tournament has not started yet), a single elimination bracket is built from the seeds
+    :param edition: the MMC edition to load
+    :returns: a tuple of the challonge names of the entrants, the elimination style (single or double), the slots of every match in play order,
+    the placement the loser of each match gets (0 if the loser is not eliminated) and, for a grand final reset, the side of the first grand final
+    the winners bracket finalist is on (-1 for every other match)
+    """
+    with open(f"MMC/mmc{edition}/participants.json", "r") as file:
+        partsData = json.loads(file.read())
+    if os.path.exists(f"MMC/mmc{edition}/matches.json"):
+        with open(f"MMC/mmc{edition}/matches.json", "r") as file:
+            matchesData = json.loads(file.read())
+        if matchesData:
+            return bracketFromMatches(partsData, matchesData)
+    return bracketFromSeeds(partsData)
+
+def playOrder(matchesData) -> List[dict]:
+    """
+    Function for ordering the matches of a challonge bracket so every match comes after the matches feeding into it
+    Challonge's suggested_play_order is missing on older brackets, so the order comes from the prereq matches (Kahn's algorithm)
+    and the suggested play order and match id only break ties
+    :param matchesData: a json loads object holding the matches.json data
+    :returns: the matches in an order they can be played in
+    """
+    byID: Dict[int, dict] = {m["id"]: m for m in matchesData}
+    waitingOn: Dict[int, int] = dict() # for counting how many prereq matches each match is still waiting on
+    feeds: Dict[int, List[int]] = {m["id"]: [] for m in matchesData} # for finding the matches a match feeds into
+    for m in matchesData:
+        prereqs = {m["player1_prereq_match_id"], m["player2_prereq_match_id"]} - {None}
+        for prereq in prereqs:
+            if prereq not in byID:
+                raise ValueError(f"Match {m['id']} depends on match {prereq} which is not in the bracket")
+            feeds[prereq].append(m["id"])
+        waitingOn[m["id"]] = len(prereqs)
+    tieBreak = lambda m: (m["suggested_play_order"] or 0, m["id"])
+    ready = [(tieBreak(m), m["id"]) for m in matchesData if waitingOn[m["id"]] == 0]
+    heapq.heapify(ready)
+    order: List[dict] = []
+    while ready:
+        _, matchID = heapq.heappop(ready)
+        order.append(byID[matchID])
+        for nextID in feeds[matchID]:
+            waitingOn[nextID] -= 1
+            if waitingOn[nextID] == 0:
+                heapq.heappush(ready, (tieBreak(byID[nextID]), nextID))
+    if len(order) != len(matchesData):
+        raise ValueError("The bracket has matches that depend on each other in a loop")
+    return order
+
+def bracketFromMatches(partsData, matchesData) -> Tuple[List[str], str, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Function for turning a challonge matches.json file into a bracket that can be simulated
+    :param partsData: a json loads object holding the participants.json data
+    :param matchesData: a json loads object holding the matches.json data
+    :returns: see loadBracket
+    """
+    participantID: Dict[str, str] = dict() # for quick referencing a player name with their ID
+    for p in partsData:
+        participantID[str(p["id"])] = p["name"]
+    # loser bracket rounds are labeled as a negative, so if a negative round is encountered, we know this tournament was double elim
+    elim: str = "d" if any(int(m["round"]) < 0 for m in matchesData) else "s"
+    matchesData = playOrder(matchesData)
+    position: Dict[int, int] = {m["id"]: i for i, m in enumerate(matchesData)}
+    names: List[str] = []
+    entrant: Dict[str, int] = dict()
+    slots = np.zeros((len(matchesData), 2, 2), dtype=np.int64)
+    droppedLosers = set() # matches whose loser moves to the losers bracket instead of being eliminated
+    for i, m in enumerate(matchesData):
+        for side, player in enumerate(("player1", "player2")):
+            prereq = m[f"{player}_prereq_match_id"]
+            if prereq is None:
+                pid: str = str(m[f"{player}_id"])
+                if pid not in entrant:
+                    entrant[pid] = len(names)
+                    names.append(participantID[pid])
+                slots[i, side] = (ENTRANT, entrant[pid])
+            elif m[f"{player}_is_prereq_match_loser"]:
+                slots[i, side] = (LOSEROF, position[prereq])
+                droppedLosers.add(position[prereq])
+            else:
+                slots[i, side] = (WINNEROF, position[prereq])
+    # a grand final reset has both players coming from the first grand final, it is only played if the losers bracket side won that
+    resets = np.full(len(matchesData), -1, dtype=np.int64)
+    for i, m in enumerate(matchesData):
+        if m["player1_prereq_match_id"] is not None and m["player1_prereq_match_id"] == m["player2_prereq_match_id"]:
+            grandFinal: int = position[m["player1_prereq_match_id"]]
+            for side in range(2):
+                kind, source = slots[grandFinal, side]
+                if kind == WINNEROF and int(matchesData[source]["round"]) > 0:
+                    resets[i] = side
+    # the grand final comes after every losers round, the rest are ordered by how deep into the bracket they are
+    stages = [(elim == "d" and int(m["round"]) > 0, abs(int(m["round"]))) for m in matchesData]
+    placements = eliminationPlacements(stages, droppedLosers)
+    return names, elim, slots, placements, resets
+
+def bracketFromSeeds(partsData) -> Tuple[List[str], str, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Function for building a seeded single elimination bracket for a tournament that has not been played yet
+    Empty spots are filled with byes, which always lose
+    :param partsData: a json loads object holding the participants.json data
+    :returns: see loadBracket, a bye is given the entrant index len(names)
+    """
+    # only use people who checked in, unless check in has not happened yet
+    entrants = [p for p in partsData if p["checked_in"]] or [p for p in partsData if not p["on_waiting_list"]]
+    entrants.sort(key=lambda p: p["seed"])
+    names: List[str] = [p["name"] for p in entrants]
+    size: int = 2
+    while size < len(names):
+        size *= 2
+    # standard seeding, 1 plays the lowest seed, 2 plays the second lowest, and so on, with 1 and 2 on opposite halves
+    order: List[int] = [0]
+    while len(order) < size:
+        order = [s for seed in order for s in (seed, 2 * len(order) - 1 - seed)]
+    bye: int = len(names)
+    slots: List[Tuple[Tuple[int, int], Tuple[int, int]]] = []
+    stages: List[Tuple[bool, int]] = []
+    previous = [(ENTRANT, seed if seed < len(names) else bye) for seed in order]
+    rnd: int = 1
+    while len(previous) > 1:
+        current = []
+        for a, b in zip(previous[::2], previous[1::2]):
+            current.append((WINNEROF, len(slots)))
+            slots.append((a, b))
+            stages.append((False, rnd))
+        previous = current
+        rnd += 1
+    placements = eliminationPlacements(stages, set())
+    return names, "s", np.array(slots, dtype=np.int64), placements, np.full(len(slots), -1, dtype=np.int64)
+
+def eliminationPlacements(stages: List[Tuple[bool, int]], droppedLosers) -> np.ndarray:
+    """
+    Function for working out what final rank the loser of each match gets, the same way challonge does it.
+    Everyone knocked out in the same stage shares a rank, which is 2 plus the number of players knocked out after them
+    :param stages: a sortable stage for every match, later stages are further into the bracket
+    :param droppedLosers: the matches whose loser is not eliminated
+    :returns: a numpy array with the rank of the loser of every match, 0 if the loser is not eliminated
+    """
+    placements = np.zeros(len(stages), dtype=np.int64)
+    eliminating = [i for i in range(len(stages)) if i not in droppedLosers]
+    for i in eliminating:
+        later: int = sum(1 for j in eliminating if stages[j] > stages[i])
+        placements[i] = 2 + later
+    return placements
+
+def winProbabilities(c: sqlite3.Cursor, names: List[str], edition: int) -> np.ndarray:
+    """
+    Function for estimating the chance every entrant has of beating every other entrant
+    Only matches from before the edition are used, so past editions can be used to check how good the predictions are
+    :param c: sqlite3 cursor
+    :param names: the challonge names of the entrants
+    :param edition: the MMC edition being predicted
+    :returns: a square numpy array, row player beating column player. An extra last row and column is a bye that always loses
+    """
+    playerNames, winners, losers, winnerRaces, loserRaces = loadHistory(c, edition)
+    prior = racePrior(winnerRaces, loserRaces)
+    ratings = fitRatings(len(playerNames), winners, losers, prior[winnerRaces, loserRaces])
+    index: Dict[str, int] = {name: i for i, name in enumerate(playerNames)}
+    strength = np.zeros(len(names))
+    race = np.full(len(names), len(races))
+    for i, cname in enumerate(names):
+        c.execute("SELECT p.NAME, p.MAINRACE FROM ChallongeNames cn JOIN Player p ON p.NAME = cn.NAME WHERE cn.CNAME = ?", (cname,))
+        result = c.fetchone()
+        # players who have never played before get an average rating and no race prior
+        if result:
+            if result[0] in index:
+                strength[i] = ratings[index[result[0]]]
+            race[i] = raceIndex(result[1])
+    probs = np.zeros((len(names) + 1, len(names) + 1))
+    probs[:-1, :-1] = 1 / (1 + np.exp(-(strength[:, None] - strength[None, :] + prior[race[:, None], race[None, :]])))
+    probs[:-1, -1] = 1
+    return probs
+
+def simulateChunk(slots: np.ndarray, placements: np.ndarray, resets: np.ndarray, probs: np.ndarray, runs: int, seed, top: int=8) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Function for simulating a bracket many times at once
+    Every match is played for all runs in one go, so the work is done by numpy instead of a python loop per run
+    :param slots: the slots of every match in play order, see loadBracket
+    :param placements: the rank the loser of each match gets, 0 if not eliminated
+    :param resets: for a grand final reset, the side of the first grand final the winners bracket finalist is on, -1 otherwise
+    :param probs: the win probability matrix from winProbabilities
+    :param runs: how many times to simulate the bracket
+    :param seed: the seed for the random number generator
+    :param top: the rank a player has to reach to count towards the top placement odds
+    :returns: a tuple of numpy arrays, how many runs each entrant won the title and how many runs each entrant finished within the top placements
+    """
+    rng = np.random.default_rng(seed)
+    numEntrants: int = probs.shape[0]
+    winners = np.empty((len(slots), runs), dtype=np.int64)
+    losers = np.empty((len(slots), runs), dtype=np.int64)
+    topCount = np.zeros(numEntrants, dtype=np.int64)
+    for i in range(len(slots)):
+        players = []
+        for kind, value in slots[i]:
+            if kind == ENTRANT:
+                players.append(np.full(runs, value))
+            elif kind == WINNEROF:
+                players.append(winners[value])
+            else:
+                players.append(losers[value])
+        first, second = players
+        firstWins = rng.random(runs) < probs[first, second]
+        if resets[i] >= 0:
+            # the reset is only played when the winners bracket finalist lost the first grand final,
+            # otherwise the first grand final result stands and is carried over as the result of the reset
+            grandFinal: int = int(slots[i, 0, 1])
+            # that side of the first grand final is always the winner of the winners final
+            winnersSide = winners[slots[grandFinal, resets[i], 1]]
+            firstWins = np.where(winners[grandFinal] == winnersSide, first == winners[grandFinal], firstWins)
+        winners[i] = np.where(firstWins, first, second)
+        losers[i] = np.where(firstWins, second, first)
+        if 0 < placements[i] <= top:
+            topCount += np.bincount(losers[i], minlength=numEntrants)
+    # the champion is the winner of the match whose loser gets second
+    final: int = int(np.flatnonzero(placements == 2)[-1])
+    titleCount = np.bincount(winners[final], minlength=numEntrants)
+    topCount += titleCount
+    # drop the bye
+    return titleCount[:-1], topCount[:-1]
+
+def predict(edition: int, runs: int=100000, workers: int=None, seed: int=None, dbName: str="mmc.db") -> Tuple[str, List[Tuple[str, float, float]]]:
+    """
+    Function for predicting the results of a specific MMC
+    The runs are split evenly across a pool of processes, each with its own random number stream
+    :param edition: the MMC edition to predict
+    :param runs: the total number of times to simulate the bracket
+    :param workers: the number of processes to use, default is one per cpu
+    :param seed: the seed for the random number generator, leave as None for a different result each time
+    :param dbName: the sqlite database file the ratings are fitted from
+    :returns: the elimination style of the bracket and a list of tuples of the challonge name, title odds and top 8 odds of every entrant, best title odds first
+    """
+    names, elim, slots, placements, resets = loadBracket(edition)
+    conn: sqlite3.Connection = connect(dbName)
+    c: sqlite3.Cursor = conn.cursor()
+    probs = winProbabilities(c, names, edition)
+    conn.close()
+
+    workers = workers or os.cpu_count() or 1
+    chunks = [runs // workers + (1 if i < runs % workers else 0) for i in range(workers)]
+    chunks = [chunk for chunk in chunks if chunk > 0]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    titleCount = np.zeros(len(names), dtype=np.int64)
+    topCount = np.zeros(len(names), dtype=np.int64)
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        results = pool.map(simulateChunk, [slots] * len(chunks), [placements] * len(chunks), [resets] * len(chunks), [probs] * len(chunks), chunks, seeds)
+        for title, top in results:
+            titleCount += title
+            topCount += top
+
+    odds = [(names[i], titleCount[i] / runs, topCount[i] / runs) for i in range(len(names))]
+    odds.sort(key=lambda o: (o[1], o[2]), reverse=True)
+    return elim, odds
+
+def showPredictions(edition: int, runs: int=100000, workers: int=None, seed: int=None, dbName: str="mmc.db") -> None:
+    """
+    Function for printing the predicted title and top 8 odds of every entrant of a specific MMC
+    :param edition: the MMC edition to predict
+    :param runs: the total number of times to simulate the bracket
+    :param workers: the number of processes to use, default is one per cpu
+    :param seed: the seed for the random number generator
+    :param dbName: the sqlite database file the ratings are fitted from
+    """
+    elim, odds = predict(edition, runs, workers, seed, dbName)
+    style: str = "double" if elim == "d" else "single"
+    print(f"MMC #{edition} ({style} elimination) predictions from {runs} simulations")
+    for name, title, top in odds:
+        print(f"{name}: Title %: {round(title * 100, 1)} | Top 8 %: {round(top * 100, 1)}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Predict the results of an MMC by simulating its bracket")
+    parser.add_argument("edition", type=int, help="the MMC edition to predict, its participants.json must be in the MMC folder")
+    parser.add_argument("--runs", type=int, default=100000, help="how many times to simulate the bracket")
+    parser.add_argument("--workers", type=int, default=None, help="how many processes to use, default is one per cpu")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the random number generator")
+    parser.add_argument("--db", default="mmc.db", help="the sqlite database file to use, default is mmc.db")
+    args = parser.parse_args()
+
+    showPredictions(args.edition, args.runs, args.workers, args.seed, args.db)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,375 @@
+import sqlite3
+
+def connect(dbName: str="mmc.db") -> sqlite3.Connection:
+    """
+    Function for connecting to a specific database.
+    Default is mmc.db
+    """
+    conn: sqlite3.Connection = sqlite3.connect(dbName)
+    conn.execute("PRAGMA foreign_keys = 1")
+    return conn
+
+def whatRound(round: int, elimination: str, maxRounds: int) -> str:
+    """
+    Function for turning a round number from the Matches table into the name of the round
+    :param round: the round number, negative for losers bracket rounds
+    :param elimination: the elimination style of the MMC, s (single) or d (double)
+    :param maxRounds: the number of rounds the MMC had
+    :returns: the name of the round
+    """
+    # if single elimination
+    if elimination == "s":
+        if maxRounds == 4:
+            roundName = {
+                4 : "Finals",
+                3 : "Semi-Finals",
+                2 : "Quarter Finals",
+                1 : "Ro16"
+            }
+            return roundName[round]
+        elif maxRounds == 5:
+            roundName = {
+                5 : "Finals",
+                4 : "Semi-Finals",
+                3 : "Quarter Finals",
+                2 : "Ro16",
+                1 : "Ro32"
+            }
+            return roundName[round]
+        elif maxRounds == 6:
+            roundName = {
+                6 : "Finals",
+                5 : "Semi-Finals",
+                4 : "Quarter Finals",
+                3 : "Ro16",
+                2 : "Ro32",
+                1 : "Ro64"
+            }
+            return roundName[round]
+        else:
+            print(f"There is no name for a tournament with a max round of {maxRounds}")
+            return
+    # if double elimination
+    elif elimination == "d":
+        if maxRounds == 4:
+            roundName = {
+                4 : "Finals",
+                3 : "Winners Final",
+                2 : "Winners Semi-Finals",
+                1 : "Winners Quarter Finals",
+                -1 : "Losers Round 1",
+                -2 : "Losers Quarter Finals",
+                -3 : "Losers Semi-Finals",
+                -4 : "Losers Finals"
+            }
+            return roundName[round]
+        elif maxRounds == 5:
+            roundName = {
+                5 : "Finals",
+                4 : "Winners Final",
+                3 : "Winners Semi-Finals",
+                2 : "Winners Quarter Finals",
+                1 : "Winners Ro16",
+                -1 : "Losers Round 1",
+                -2 : "Losers Round 2",
+                -3 : "Losers Quarter Finals",
+                -4 : "Losers Semi-Finals",
+                -5 : "Losers Final"
+            }
+            return roundName[round]
+        else:
+            print(f"There is no name for a tournament with a max round of {maxRounds}")
+            return
+    else:
+        print("No elimination type given")
+        return
+
+def numberOfMMC(NAME: str, dbName: str="mmc.db") -> None:
+    """
+    Function for printing how many MMC's a player has played in and which ones
+    :param NAME: the standardized name of the player
+    :param dbName: the sqlite database file to query
+    """
+    conn: sqlite3.Connection = connect(dbName)
+    c: sqlite3.Cursor = conn.cursor()
+
+    cnames = [] # for collecting all the challonge names a player has had
+    specificMMC = [] # for recording the specific editions a player has played in
+    c.execute("SELECT * FROM ChallongeNames WHERE NAME = ?", (NAME,)) # query all challonge names a player has had
+    results = c.fetchall()
+    for r in results:
+        cnames.append(r[0])
+    for cn in cnames:
+        c.execute("SELECT * FROM Participants WHERE CNAME = ?",(cn,))
+        results = c.fetchall()
+        for r in results:
+            c.execute("SELECT NUMBER FROM MMC WHERE TOURNAMENTID = ?", (r[3],))
+            results2 = c.fetchone()
+            if results2[0]:
+                specificMMC.append(results2[0])
+    specificMMC.sort()
+    # print results
+    if len(specificMMC) == 0:
+        print(f"{NAME} has never played in an MMC")
+    elif len(specificMMC) == 1:
+        print(f"{NAME} has played in {len(specificMMC)} MMC")
+        print(f"The specific edition {NAME} has played in is: {specificMMC[0]}")
+    else:
+        print(f"{NAME} has played in {len(specificMMC)} MMC's")
+        print(f"The specific editions {NAME} has played in are:")
+        num = 0
+        for i in range(len(specificMMC) - 1):
+            if num < 10:
+                print(f"{specificMMC[i]}, ", end="")
+                num += 1
+            else:
+                print(f"{specificMMC[i]}")
+                num = 0
+        print(specificMMC[-1])
+    conn.close()
+    return
+
+def winLossRecord(NAME: str, dbName: str="mmc.db") -> None:
+    """
+    Function for printing the career match and map record of a player
+    :param NAME: the standardized name of the player
+    :param dbName: the sqlite database file to query
+    """
+    conn: sqlite3.Connection = connect(dbName)
+    c: sqlite3.Cursor = conn.cursor()
+
+    cnames = [] # for collecting all the challonge names a player has had
+    cid = set() # for saving all of the challonge id's
+    matchesWon = [] # for matches won 
+    matchesLost = [] # for matches lost
+    maps = {"maps won": 0, "maps lost": 0} # for tracking maps won and lost
+    scores = {"1-0": 0, "0-1": 0, "2-0": 0, "0-2": 0, "2-1": 0, "1-2": 0, "3-0": 0, "3-1": 0, "3-2": 0, "0-3": 0, "1-3": 0, "2-3": 0}
+    woWon = [] # for matches won by walkover
+    woLost = [] # for matches lost by walkover
+
+    # get the challonge names used on the brackets
+    c.execute("SELECT * FROM ChallongeNames WHERE NAME = ?", (NAME,)) # query all challonge names a player has had
+    results = c.fetchall()
+    for r in results:
+        cnames.append(r[0])
+
+    # get the challonge id's that will appear in the matches
+    for cn in cnames:
+        c.execute("SELECT * FROM Participants WHERE CNAME = ?",(cn,))
+        results = c.fetchall()
+        for r in results:
+            cid.add(r[0])
+
+    # get all the matches a player has played
+    for ids in cid:
+        # get all the wins
+        c.execute("SELECT * FROM MATCHES WHERE WINNERID = ?", (ids,))
+        results = c.fetchall()
+        for r in results:
+            # check if it was a walkover
+            if r[5] == -1:
+                woWon.append(r)
+            else:
+                maps["maps won"] += r[4]
+                maps["maps lost"] += r[5]
+                scores[f"{r[4]}-{r[5]}"] += 1
+                matchesWon.append(r)
+        # get all thheh losses
+        c.execute("SELECT * FROM MATCHES WHERE LOSERID = ?", (ids,))
+        results = c.fetchall()
+        for r in results:
+            # check if it was a walkover
+            if r[5] == -1:
+                woLost.append(r)
+            else:
+                maps["maps won"] += r[5]
+                maps["maps lost"] += r[4]
+                scores[f"{r[5]}-{r[4]}"] += 1
+                matchesLost.append(r)
+
+    # display results
+    print(f"{NAME} Career Record: {len(matchesWon)+len(woWon)}-{len(matchesLost)+len(woLost)}  Maps: {maps['maps won']}-{maps['maps lost']}")
+    print(f"Wins: {len(matchesWon)}")
+    print(f"Losses: {len(matchesLost)}")
+    print(f"Wins by Walkover: {len(woWon)}")
+    print(f"Losses by Walkover: {len(woLost)}")
+    print("Map Scores:")
+    num = 0
+    for key, value in scores.items():
+        if value > 0:
+            if num < 5:
+                print(f"{key}: {value}  ", end="")
+                num += 1
+            else:
+                print(f"{key}: {value}  ")
+                num = 0
+
+    conn.close()
+
+def matchHistory(NAME1: str, NAME2: str, dbName: str="mmc.db") -> None:
+    """
+    Function for printing every match two players have played against each other
+    :param NAME1: the standardized name of the first player
+    :param NAME2: the standardized name of the second player
+    :param dbName: the sqlite database file to query
+    """
+    conn: sqlite3.Connection = connect(dbName)
+    c: sqlite3.Cursor = conn.cursor()
+
+    cnames1 = [] # for collecting all the challonge names NAME1 has had
+    cnames2 = [] # for collecting all the challonge names NAME2 has had
+    cid1 = set() # for saving all of the challonge id's for NAME1
+    cid2 = set() # for saving all of the challonge id's for NAME2
+    n1Wins = []
+    n2Wins = []
+
+    # get the challonge names used on the brackets for NAME1
+    c.execute("SELECT * FROM ChallongeNames WHERE NAME = ?", (NAME1,)) # query all challonge names NAME1 has had
+    results = c.fetchall()
+    for r in results:
+        cnames1.append(r[0])
+
+    # get the challonge names used on the brackets for NAME2
+    c.execute("SELECT * FROM ChallongeNames WHERE NAME = ?", (NAME2,)) # query all challonge names NAME2 has had
+    results = c.fetchall()
+    for r in results:
+        cnames2.append(r[0])
+
+    # get the challonge id's for NAME1
+    for c1 in cnames1:
+        c.execute("SELECT * FROM Participants WHERE CNAME = ?",(c1,))
+        results = c.fetchall()
+        for r in results:
+            cid1.add(r[0])
+    
+    # get the challonge id's for NAME2
+    for c2 in cnames2:
+        c.execute("SELECT * FROM Participants WHERE CNAME = ?",(c2,))
+        results = c.fetchall()
+        for r in results:
+            cid2.add(r[0])
+
+    # check all combos of cids
+    for c1 in cid1:
+        for c2 in cid2:
+            # wins for NAME1
+            c.execute("SELECT * FROM Matches WHERE WINNERID = ? AND LOSERID = ?", (c1,c2))
+            results = c.fetchall()
+            for r in results:
+                n1Wins.append(r)
+            # wins for NAME2
+            c.execute("SELECT * FROM Matches WHERE WINNERID = ? AND LOSERID = ?", (c2,c1))
+            results = c.fetchall()
+            for r in results:
+                n2Wins.append(r)
+    
+    # if there are no matches between two players saw so
+    if len(n1Wins) == 0 and len(n2Wins) == 0:
+        print(f"{NAME1} and {NAME2} have never played each other in MMC")
+
+    # Display Matches
+    for match in n1Wins:
+        c.execute("SELECT NUMBER,ELIMINATION,ROUNDS FROM MMC WHERE TOURNAMENTID = ?", (match[1],))
+        mmc = c.fetchone()
+        rnd = whatRound(match[6], mmc[1], mmc[2])
+        print(f"{NAME1} {match[4]} - {match[5]} {NAME2}  MMC #{mmc[0]} {rnd}")
+    for match in n2Wins:
+        c.execute("SELECT NUMBER,ELIMINATION,ROUNDS FROM MMC WHERE TOURNAMENTID = ?", (match[1],))
+        mmc = c.fetchone()
+        rnd = whatRound(match[6], mmc[1], mmc[2])
+        print(f"{NAME2} {match[4]} - {match[5]} {NAME1}  MMC #{mmc[0]} {rnd}")
+
+    conn.close()
+    return
+
+def generalRaceStatistics(dbName: str="mmc.db") -> None:
+    """
+    Function for printing the match record of every race matchup
+    :param dbName: the sqlite database file to query
+    """
+    conn: sqlite3.Connection = connect(dbName)
+    c: sqlite3.Cursor = conn.cursor()
+
+    # PvT Matches
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 'p' AND LOSERRACE = 't'")
+    results = c.fetchall()
+    pvtWins = len(results)
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 't' AND LOSERRACE = 'p'")
+    results = c.fetchall()
+    pvtLosses = len(results)
+    # PvZ Matches
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 'p' AND LOSERRACE = 'z'")
+    results = c.fetchall()
+    pvzWins = len(results)
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 'z' AND LOSERRACE = 'p'")
+    results = c.fetchall()
+    pvzLosses = len(results)
+    # TvZ Matches
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 't' AND LOSERRACE = 'z'")
+    results = c.fetchall()
+    tvzWins = len(results)
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 'z' AND LOSERRACE = 't'")
+    results = c.fetchall()
+    tvzLosses = len(results)
+    # PvP Matches
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 'p' AND LOSERRACE = 'p'")
+    results = c.fetchall()
+    pvpGames = len(results)
+    # TvT Matches
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 't' AND LOSERRACE = 't'")
+    results = c.fetchall()
+    tvtGames = len(results)
+    # ZvZ Matches
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 'z' AND LOSERRACE = 'z'")
+    results = c.fetchall()
+    zvzGames = len(results)
+    # RvP Matches
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 'r' AND LOSERRACE = 'p'")
+    results = c.fetchall()
+    rvpWins = len(results)
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 'p' AND LOSERRACE = 'r'")
+    results = c.fetchall()
+    rvpLosses = len(results)
+    # RvT Matches
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 'r' AND LOSERRACE = 't'")
+    results = c.fetchall()
+    rvtWins = len(results)
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 't' AND LOSERRACE = 'r'")
+    results = c.fetchall()
+    rvtLosses = len(results)
+    # RvZ Matches
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 'r' AND LOSERRACE = 'z'")
+    results = c.fetchall()
+    rvzWins = len(results)
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 'z' AND LOSERRACE = 'r'")
+    results = c.fetchall()
+    rvzLosses = len(results)
+    # RvR Matches
+    c.execute("SELECT * FROM Matches WHERE WINNERRACE = 'r' AND LOSERRACE = 'r'")
+    results = c.fetchall()
+    rvrGames = len(results)
+
+
+    print("Protoss Statistics:")
+    print(f"PvZ Matches: {pvzLosses + pvzWins} | Match Record: {pvzWins} - {pvzLosses} | Win %: {round(pvzWins / (pvzWins + pvzLosses) * 100, 1)}")
+    print(f"PvT Matches: {pvtLosses + pvtWins} | Match Record: {pvtWins} - {pvtLosses} | Win %: {round(pvtWins / (pvtWins + pvtLosses) * 100, 1)}")
+    print(f"PvP Matches: {pvpGames}")
+    print()
+    print("Terran Statistics:")
+    print(f"TvZ Matches: {tvzLosses + tvzWins} | Match Record: {tvzWins} - {tvzLosses} | Win %: {round(tvzWins / (tvzWins + tvzLosses) * 100, 1)}")
+    print(f"TvP Matches: {pvtLosses + pvtWins} | Match Record: {pvtLosses} - {pvtWins} | Win %: {round(pvtLosses / (pvtWins + pvtLosses) * 100, 1)}")
+    print(f"TvT Matches: {tvtGames}")
+    print()
+    print("Zerg Statistics:")
+    print(f"ZvP Matches: {pvzLosses + pvzWins} | Match Record: {pvzLosses} - {pvzWins} | Win %: {round(pvzLosses / (pvzWins + pvzLosses) * 100, 1)}")
+    print(f"ZvT Matches: {tvzLosses + tvzWins} | Match Record: {tvzLosses} - {tvzWins} | Win %: {round(tvzLosses / (tvzWins + tvzLosses) * 100, 1)}")
+    print(f"ZvZ Matches: {zvzGames}")
+    print()
+    print("Random Statistics:")
+    print(f"RvP Matches: {rvpWins + rvpLosses} | Match Record: {rvpWins} - {rvpLosses} | Win %: {round(rvpWins / (rvpWins + rvpLosses) * 100, 1)}")
+    print(f"RvT Matches: {rvtWins + rvtLosses} | Match Record: {rvtWins} - {rvtLosses} | Win %: {round(rvtWins / (rvtWins + rvtLosses) * 100, 1)}")
+    print(f"RvZ Matches: {rvzWins + rvzLosses} | Match Record: {rvzWins} - {rvzLosses} | Win %: {round(rvzWins / (rvzWins + rvzLosses) * 100, 1)}")
+    print(f"RvR Matches: {rvrGames}")
+
+    conn.close()
+    return
@@ -0,0 +1,289 @@
+import sqlite3
+from typing import Dict, List, Tuple
+import os
+import re
+import json
+import html
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from queries import whatRound
+
+reportVersion: str = "1" # change this when the page layout changes so every page is rendered again
+races: Dict[str, str] = {"p": "Protoss", "t": "Terran", "z": "Zerg", "r": "Random"} # full names of the races for the pages
+
+def connect(dbName: str="mmc.db") -> sqlite3.Connection:
+    """
+    Function for connecting to a specific database.
+    Default is mmc.db
+    """
+    return sqlite3.connect(dbName)
+
+def slug(name: str) -> str:
+    """
+    Function for turning a player name into a safe file name
+    Names with characters that can't be in a file name or with capital letters get a short hash of the name added,
+    so names that only differ by those characters or by case (MatheuS and Matheus) still get their own page on case insensitive file systems
+    :param name: the standardized name of the player
+    :returns: the file name to use, without an extension
+    """
+    safe: str = re.sub(r"[^A-Za-z0-9_-]", "_", name)
+    if safe != name or name != name.lower():
+        safe += "-" + hashlib.sha1(name.encode("utf-8")).hexdigest()[:6]
+    return safe
+
+def roundName(mRound: int, elimination: str, maxRounds: int) -> str:
+    """
+    Function for naming a round, using whatRound when it knows the round
+    Some double elimination MMC's have more losers rounds than whatRound has names for, those are just numbered
+    :param mRound: the round number, negative for losers bracket rounds
+    :param elimination: the elimination style of the MMC, s (single) or d (double)
+    :param maxRounds: the number of rounds the MMC had
+    :returns: the name of the round
+    """
+    try:
+        name = whatRound(mRound, elimination, maxRounds)
+    except KeyError:
+        name = None
+    if name is None:
+        name = f"Losers Round {-mRound}" if mRound < 0 else f"Round {mRound}"
+    return name
+
+def newPlayer(name: str, race: str="nan", country: str="nan", team: str="nan", offRace: str="nan") -> dict:
+    """
+    Function for making the empty page data of a player
+    :returns: a dictionary with the player details and every stat set to zero
+    """
+    return {"name": name, "race": race, "country": country, "team": team, "offRace": offRace,
+            "challongeNames": [], "editions": [], "titles": [],
+            "wins": 0, "losses": 0, "walkoverWins": 0, "walkoverLosses": 0, "mapsWon": 0, "mapsLost": 0,
+            "scores": dict(), "matchups": dict(), "matches": []}
+
+def collectStats(c: sqlite3.Cursor) -> Tuple[Dict[str, dict], Dict[int, dict]]:
+    """
+    Function for working out the stats of every player and every MMC
+    Every table is read once and every match is only looked at once, instead of running queries for each player
+    :param c: sqlite3 cursor
+    :returns: a tuple of dictionaries, the page data of every player keyed by name and the page data of every MMC keyed by number
+    """
+    players: Dict[str, dict] = dict()
+    c.execute("SELECT * FROM Player")
+    for name, race, country, team, offRace in c.fetchall():
+        players[name] = newPlayer(name, race, country, team, offRace)
+    # ChallongeNames can point at a name missing from Player, give those players an empty page too
+    cnames: Dict[str, str] = dict() # for quick referencing a challonge username with the standardized name
+    c.execute("SELECT * FROM ChallongeNames")
+    for cname, name in c.fetchall():
+        cnames[cname] = name
+        if name not in players:
+            players[name] = newPlayer(name)
+        players[name]["challongeNames"].append(cname)
+
+    editions: Dict[int, dict] = dict()
+    tournaments: Dict[str, dict] = dict() # for quick referencing an MMC with its tournament id
+    c.execute("SELECT * FROM MMC")
+    for tournamentID, number, elim, rounds, date in c.fetchall():
+        editions[number] = {"number": number, "date": date, "elimination": elim, "rounds": rounds,
+                            "participants": [], "champion": None, "runnerUp": None, "matches": []}
+        tournaments[tournamentID] = editions[number]
+
+    participantID: Dict[str, str] = dict() # for quick referencing a challonge id with the standardized name
+    c.execute("SELECT * FROM Participants")
+    for challongeID, cname, _, tournamentID in c.fetchall():
+        name: str = cnames[cname]
+        participantID[challongeID] = name
+        edition = tournaments[tournamentID]
+        edition["participants"].append(name)
+        players[name]["editions"].append(edition["number"])
+
+    # ordered by match id so that when an MMC has two final round matches (a grand final reset) the later one is the final
+    c.execute("SELECT * FROM Matches ORDER BY CAST(MATCHID AS INTEGER)")
+    for _, tournamentID, winnerID, loserID, winnerScore, loserScore, mRound, winnerRace, loserRace in c.fetchall():
+        edition = tournaments[tournamentID]
+        winner = players[participantID[winnerID]]
+        loser = players[participantID[loserID]]
+        rName: str = roundName(mRound, edition["elimination"], edition["rounds"])
+        walkover: bool = loserScore == -1
+        score: str = "W/O" if walkover else f"{winnerScore}-{loserScore}"
+        edition["matches"].append({"round": mRound, "roundName": rName, "winner": winner["name"], "loser": loser["name"], "score": score})
+        # the last match with the highest round is the final
+        if mRound == edition["rounds"]:
+            edition["champion"] = winner["name"]
+            edition["runnerUp"] = loser["name"]
+        for player, opponent, won in ((winner, loser, True), (loser, winner, False)):
+            player["matches"].append({"mmc": edition["number"], "round": mRound, "roundName": rName, "opponent": opponent["name"],
+                                      "result": "W" if won else "L", "score": score if won or walkover else f"{loserScore}-{winnerScore}"})
+        if walkover:
+            winner["walkoverWins"] += 1
+            loser["walkoverLosses"] += 1
+            continue
+        winner["wins"] += 1
+        loser["losses"] += 1
+        winner["mapsWon"] += winnerScore
+        winner["mapsLost"] += loserScore
+        loser["mapsWon"] += loserScore
+        loser["mapsLost"] += winnerScore
+        winner["scores"][f"{winnerScore}-{loserScore}"] = winner["scores"].get(f"{winnerScore}-{loserScore}", 0) + 1
+        loser["scores"][f"{loserScore}-{winnerScore}"] = loser["scores"].get(f"{loserScore}-{winnerScore}", 0) + 1
+        # matchup records are kept against the race the opponent played that match
+        winner["matchups"].setdefault(loserRace, [0, 0])[0] += 1
+        loser["matchups"].setdefault(winnerRace, [0, 0])[1] += 1
+
+    # titles are only given out once every match has been seen, so each MMC has exactly one champion
+    for edition in editions.values():
+        if edition["champion"] is not None:
+            players[edition["champion"]]["titles"].append(edition["number"])
+
+    # sort everything so the pages (and their hashes) don't depend on the order the database returned rows in
+    for player in players.values():
+        player["challongeNames"].sort()
+        player["editions"].sort()
+        player["titles"].sort()
+        player["matches"].sort(key=lambda m: (m["mmc"], m["round"] < 0, abs(m["round"])))
+    for edition in editions.values():
+        edition["participants"].sort()
+        edition["matches"].sort(key=lambda m: (m["round"] < 0, abs(m["round"])))
+    return players, editions
+
+def table(headers: List[str], rows: List[List]) -> str:
+    """
+    Function for making an html table
+    :param headers: the column headers
+    :param rows: the rows of the table, every cell is escaped
+    :returns: the html of the table
+    """
+    head: str = "".join(f"<th>{html.escape(str(h))}</th>" for h in headers)
+    body: str = "".join("<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in r) + "</tr>" for r in rows)
+    return f"<table><tr>{head}</tr>{body}</table>"
+
+def page(title: str, body: str) -> str:
+    """
+    Function for wrapping the body of a page in the html every page shares
+    :param title: the title of the page
+    :param body: the html of the page contents
+    :returns: the full html page
+    """
+    return (f"<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>{html.escape(title)}</title></head>"
+            f"<body><p><a href=\"../index.html\">All players and MMC's</a></p><h1>{html.escape(title)}</h1>{body}</body></html>")
+
+def renderPlayer(data: dict) -> str:
+    """
+    Function for making the html page of a player
+    :param data: the page data of the player from collectStats
+    :returns: the html of the page
+    """
+    details = [["Race", races.get(data["race"], data["race"])], ["Off Race", races.get(data["offRace"], data["offRace"])],
+               ["Country", data["country"]], ["Team", data["team"]], ["Challonge Names", ", ".join(data["challongeNames"])],
+               ["MMC's Played", len(data["editions"])], ["Titles", ", ".join(f"#{n}" for n in data["titles"]) or "None"],
+               ["Career Record", f"{data['wins'] + data['walkoverWins']}-{data['losses'] + data['walkoverLosses']}"],
+               ["Maps", f"{data['mapsWon']}-{data['mapsLost']}"],
+               ["Walkovers", f"{data['walkoverWins']}-{data['walkoverLosses']}"]]
+    matchups = [[f"vs {races.get(race, race)}", f"{w}-{l}", f"{round(w / (w + l) * 100, 1)}"] for race, (w, l) in sorted(data["matchups"].items())]
+    scores = [[score, count] for score, count in sorted(data["scores"].items())]
+    matches = [[f"#{m['mmc']}", m["roundName"], m["result"], m["score"], m["opponent"]] for m in data["matches"]]
+    body: str = (table(["", ""], details)
+                 + "<h2>Race Matchups</h2>" + table(["Matchup", "Record", "Win %"], matchups)
+                 + "<h2>Map Scores</h2>" + table(["Score", "Matches"], scores)
+                 + "<h2>Matches</h2>" + table(["MMC", "Round", "Result", "Score", "Opponent"], matches))
+    return page(data["name"], body)
+
+def renderEdition(data: dict) -> str:
+    """
+    Function for making the html page of an MMC
+    :param data: the page data of the MMC from collectStats
+    :returns: the html of the page
+    """
+    details = [["Date", data["date"]], ["Elimination", "Double" if data["elimination"] == "d" else "Single"],
+               ["Players", len(data["participants"])], ["Champion", data["champion"]], ["Runner Up", data["runnerUp"]]]
+    matches = [[m["roundName"], m["winner"], m["score"], m["loser"]] for m in data["matches"]]
+    body: str = (table(["", ""], details)
+                 + "<h2>Matches</h2>" + table(["Round", "Winner", "Score", "Loser"], matches)
+                 + "<h2>Players</h2><p>" + html.escape(", ".join(data["participants"])) + "</p>")
+    return page(f"MMC #{data['number']}", body)
+
+def renderIndex(data: dict) -> str:
+    """
+    Function for making the index page that links to every other page
+    :param data: the lists of players (name and file name) and MMC numbers
+    :returns: the html of the page
+    """
+    editions: str = "".join(f"<li><a href=\"mmc/{n}.html\">MMC #{n}</a></li>" for n in data["editions"])
+    players: str = "".join(f"<li><a href=\"players/{file}.html\">{html.escape(name)}</a></li>" for name, file in data["players"])
+    return (f"<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>MMC Stats</title></head>"
+            f"<body><h1>MMC Stats</h1><h2>MMC's</h2><ul>{editions}</ul><h2>Players</h2><ul>{players}</ul></body></html>")
+
+renderers = {"player": renderPlayer, "mmc": renderEdition, "index": renderIndex}
+
+def renderPages(outDir: str, pages: List[Tuple[str, str, dict]]) -> int:
+    """
+    Function for writing the html and json files of a group of pages, run by each worker process
+    :param outDir: the folder the reports go in
+    :param pages: a list of tuples of the page type, the path of the page without an extension and the page data
+    :returns: the number of pages written
+    """
+    for kind, path, data in pages:
+        with open(f"{outDir}/{path}.html", "w", encoding="utf-8") as outfile:
+            outfile.write(renderers[kind](data))
+        with open(f"{outDir}/{path}.json", "w", encoding="utf-8") as outfile:
+            outfile.write(json.dumps(data, indent=4))
+    return len(pages)
+
+def generateReports(dbName: str="mmc.db", outDir: str="reports", workers: int=None, force: bool=False) -> Tuple[int, int]:
+    """
+    Function for generating the stats pages of every player and every MMC
+    Pages whose data has not changed since the last run are skipped, the rest are split between a pool of processes
+    :param dbName: the sqlite database file to use
+    :param outDir: the folder the reports go in
+    :param workers: the number of processes to use, default is one per cpu
+    :param force: set to True to render every page even if it has not changed
+    :returns: a tuple of the number of pages written and the number skipped
+    """
+    conn: sqlite3.Connection = connect(dbName)
+    c: sqlite3.Cursor = conn.cursor()
+    players, editions = collectStats(c)
+    conn.close()
+
+    pages: List[Tuple[str, str, dict]] = [("player", f"players/{slug(name)}", data) for name, data in sorted(players.items())]
+    pages += [("mmc", f"mmc/{number}", data) for number, data in sorted(editions.items())]
+    pages.append(("index", "index", {"editions": sorted(editions), "players": [[name, slug(name)] for name in sorted(players)]}))
+
+    # the manifest keeps a hash of the data every page was last made from
+    manifestFile: str = f"{outDir}/manifest.json"
+    manifest: Dict[str, str] = dict()
+    if os.path.exists(manifestFile):
+        with open(manifestFile, "r") as file:
+            manifest = json.loads(file.read())
+    os.makedirs(f"{outDir}/players", exist_ok=True)
+    os.makedirs(f"{outDir}/mmc", exist_ok=True)
+
+    changed: List[Tuple[str, str, dict]] = []
+    hashes: Dict[str, str] = dict()
+    for kind, path, data in pages:
+        hashes[path] = hashlib.sha1((reportVersion + json.dumps(data, sort_keys=True)).encode("utf-8")).hexdigest()
+        if force or manifest.get(path) != hashes[path] or not os.path.exists(f"{outDir}/{path}.html"):
+            changed.append((kind, path, data))
+
+    if changed:
+        workers = min(workers or os.cpu_count() or 1, len(changed))
+        # deal the pages out round robin so every worker gets a similar mix of big and small pages
+        chunks = [changed[i::workers] for i in range(workers)]
+        if workers == 1:
+            renderPages(outDir, changed)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(renderPages, [outDir] * workers, chunks))
+
+    # pages of players that were renamed or removed from the database are deleted instead of being left behind
+    for path in manifest:
+        if path not in hashes:
+            for extension in (".html", ".json"):
+                if os.path.exists(f"{outDir}/{path}{extension}"):
+                    os.remove(f"{outDir}/{path}{extension}")
+
+    with open(manifestFile, "w") as outfile:
+        outfile.write(json.dumps(hashes, indent=4))
+    return len(changed), len(pages) - len(changed)
+
+if __name__ == "__main__":
+    from mmcStats import main as cli
+    import sys
+    exit(cli(["report"] + sys.argv[1:]))